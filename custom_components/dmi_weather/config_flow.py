@@ -1,6 +1,9 @@
 """Config flow for DMI Weather integration."""
 from __future__ import annotations
 
+import logging
+import time
+
 import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.const import CONF_LATITUDE, CONF_LONGITUDE, CONF_NAME
@@ -8,7 +11,25 @@ from homeassistant.data_entry_flow import FlowResult
 from typing import Any
 
 from .const import DEFAULT_NAME, DOMAIN, CONF_API_KEY
-from .dmi_api import DMIWeatherAPI
+from .dmi_api import DMIAuthError, DMIWeatherAPI
+
+_LOGGER = logging.getLogger(__name__)
+
+# API keys that recently passed validation, mapped to their expiry time
+_VALIDATED_KEYS: dict[str, float] = {}
+_VALIDATION_TTL = 300
+
+# Accept a decimal comma in coordinates, e.g. "55,6761"
+_COMMA_TRANS = str.maketrans({",": "."})
+
+_BASE_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_NAME, default=DEFAULT_NAME): str,
+        vol.Required(CONF_API_KEY): str,
+        vol.Required(CONF_LATITUDE): str,
+        vol.Required(CONF_LONGITUDE): str,
+    }
+)
 
 
 class DMIWeatherConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -23,30 +44,19 @@ class DMIWeatherConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         if user_input is not None:
             try:
                 # Convert coordinates to float, handling comma format
-                try:
-                    lat = float(str(user_input[CONF_LATITUDE]).replace(',', '.'))
-                    lon = float(str(user_input[CONF_LONGITUDE]).replace(',', '.'))
-                except ValueError:
-                    errors["base"] = "invalid_coordinates"
-                    return self.async_show_form(
-                        step_id="user",
-                        data_schema=vol.Schema(
-                            {
-                                vol.Required(CONF_NAME, default=user_input.get(CONF_NAME, DEFAULT_NAME)): str,
-                                vol.Required(CONF_API_KEY, default=user_input.get(CONF_API_KEY, "")): str,
-                                vol.Required(CONF_LATITUDE, default=user_input.get(CONF_LATITUDE, "")): str,
-                                vol.Required(CONF_LONGITUDE, default=user_input.get(CONF_LONGITUDE, "")): str,
-                            }
-                        ),
-                        errors=errors,
-                        description_placeholders={
-                            "docs_url": "https://www.dmi.dk/data/dmi-opendata/"
-                        },
-                    )
-                
+                lat = float(str(user_input[CONF_LATITUDE]).translate(_COMMA_TRANS))
+                lon = float(str(user_input[CONF_LONGITUDE]).translate(_COMMA_TRANS))
+            except ValueError:
+                lat = lon = None
+
+            try:
                 # Validate coordinates are reasonable
-                if not (-90 <= lat <= 90) or not (-180 <= lon <= 180):
+                if lat is None or not (-90 <= lat <= 90) or not (-180 <= lon <= 180):
                     errors["base"] = "invalid_coordinates"
+                elif error := await self._async_validate_api_key(
+                    user_input[CONF_API_KEY], lat, lon
+                ):
+                    errors["base"] = error
                 else:
                     # Create the config entry with converted coordinates
                     config_data = user_input.copy()
@@ -62,18 +72,46 @@ class DMIWeatherConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 _LOGGER.error("Config flow error: %s", e)
                 errors["base"] = "cannot_connect"
 
+        return self._show_user_form(errors, user_input)
+
+    def _show_user_form(
+        self, errors: dict[str, str], user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Show the user form, keeping any previously entered values."""
+        # Only re-wrap the shared schema when re-prompting with the user's input
+        data_schema = _BASE_SCHEMA
+        if user_input is not None:
+            data_schema = self.add_suggested_values_to_schema(_BASE_SCHEMA, user_input)
+
         return self.async_show_form(
             step_id="user",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(CONF_NAME, default=DEFAULT_NAME): str,
-                    vol.Required(CONF_API_KEY): str,
-                    vol.Required(CONF_LATITUDE): str,
-                    vol.Required(CONF_LONGITUDE): str,
-                }
-            ),
+            data_schema=data_schema,
             errors=errors,
             description_placeholders={
                 "docs_url": "https://www.dmi.dk/data/dmi-opendata/"
             },
         )
+
+    async def _async_validate_api_key(self, api_key: str, lat: float, lon: float) -> str | None:
+        """Check the API key against DMI and return an error key, reusing a recent success."""
+        now = time.monotonic()
+        # Drop expired keys so they are not held in memory for the process lifetime
+        for key in [key for key, expiry in _VALIDATED_KEYS.items() if expiry <= now]:
+            del _VALIDATED_KEYS[key]
+        if api_key in _VALIDATED_KEYS:
+            return None
+
+        api = DMIWeatherAPI(self.hass, lat, lon, api_key)
+        try:
+            collections = await api._get_collections()
+        except DMIAuthError as err:
+            _LOGGER.error("API key validation failed: %s", err)
+            return "invalid_auth"
+        except Exception as err:
+            _LOGGER.error("API key validation failed: %s", err)
+            return "cannot_connect"
+
+        if not collections:
+            return "cannot_connect"
+        _VALIDATED_KEYS[api_key] = time.monotonic() + _VALIDATION_TTL
+        return None
@@ -17,6 +17,10 @@ DMI_AUTH_HEADER = "X-Gravitee-Api-Key"
 EDR_COLLECTIONS_ENDPOINT = "/collections"
 EDR_POSITION_QUERY = "/position"
 
+# Preferred forecast collection and how long the resolved id is trusted
+EDR_DEFAULT_COLLECTION = "harmonie_dini_eps_means"
+COLLECTION_CACHE_TTL = 21600  # Re-check the collection catalog every 6 hours
+
 # API request parameters
 DEFAULT_TIMEOUT = 60  # Increased to 60 seconds for slow API responses
 MAX_FORECAST_DAYS = 5
@@ -48,3 +52,14 @@ EDR_PARAMETERS = {
     "snow_precipitation": "time-integral-of-total-solid-precipitation-flux",
     "water_vapour": "total-column-vertically-integrated-water-vapour",
 }
+
+# Parameters actually consumed when processing the position query response
+EDR_REQUIRED_PARAMS = (
+    EDR_PARAMETERS["temperature"],
+    EDR_PARAMETERS["wind_speed"],
+    EDR_PARAMETERS["wind_gust"],
+    EDR_PARAMETERS["precipitation"],
+    EDR_PARAMETERS["cloud_cover"],
+    EDR_PARAMETERS["dew_point"],
+)
+EDR_REQUIRED_PARAMS_CSV = ",".join(EDR_REQUIRED_PARAMS)
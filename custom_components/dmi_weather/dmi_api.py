@@ -3,88 +3,263 @@ from __future__ import annotations
 
 import logging
 import asyncio
-from datetime import datetime, timedelta
+import random
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
 from typing import Any, Dict, List, Optional
+from aiohttp import ClientSession, ClientTimeout
 from homeassistant.core import HomeAssistant
 from homeassistant.util import dt as dt_util
+from homeassistant.util.json import json_loads
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from .const import (
     DMI_EDR_BASE_URL, DMI_AUTH_HEADER, EDR_COLLECTIONS_ENDPOINT,
-    EDR_POSITION_QUERY, DEFAULT_TIMEOUT, EDR_PARAMETERS, MAX_FORECAST_DAYS
+    EDR_POSITION_QUERY, DEFAULT_TIMEOUT, EDR_PARAMETERS, MAX_FORECAST_DAYS,
+    EDR_DEFAULT_COLLECTION, COLLECTION_CACHE_TTL, EDR_REQUIRED_PARAMS_CSV
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# Estimated condition indexed by the bit flags
+# (precipitation > 0.1mm) << 2 | (cloud cover > 80%) << 1 | (cloud cover > 30%),
+# using the keys of WEATHER_CONDITIONS; precipitation outranks cloud cover
+_WEATHER_CODES = (
+    "clear", "partly_cloudy", "cloudy", "cloudy",
+    "rain", "rain", "rain", "rain",
+)
+
+# Severity order used to pick a representative condition for a whole day
+_CONDITION_RANK = {"clear": 0, "partly_cloudy": 1, "cloudy": 2, "rain": 3}
+
+REQUEST_TIMEOUT = ClientTimeout(total=DEFAULT_TIMEOUT)
+MAX_RETRY_AFTER = 30.0
+
+
+@dataclass(slots=True)
+class HourlyWeather:
+    """Processed weather values for a single forecast hour."""
+
+    time: datetime
+    temperature: Optional[float]
+    wind_speed: Optional[float]
+    wind_gust: Optional[float]
+    precipitation: Optional[float]
+    cloud_cover: Optional[float]
+    dew_point: Optional[float]
+    weather_code: str
+    pressure: Optional[float] = None  # Not requested from the EDR API
+    humidity: Optional[float] = None  # Not requested from the EDR API
+
+
+@dataclass(slots=True)
+class DailyWeather:
+    """Weather values aggregated over one local calendar day."""
+
+    time: datetime
+    weather_code: str
+    temperature_max: Optional[float] = None
+    temperature_min: Optional[float] = None
+    precipitation: float = 0.0
+    wind_speed: Optional[float] = None
+
+
+def _parse_edr_time(value: str) -> datetime:
+    """Parse an EDR timestamp, with a fast path for the fixed YYYY-MM-DDTHH:MM:SSZ shape."""
+    if (
+        len(value) == 20
+        and value[4] == value[7] == "-"
+        and value[10] == "T"
+        and value[13] == value[16] == ":"
+        and value[19] == "Z"
+    ):
+        try:
+            return datetime(
+                int(value[0:4]), int(value[5:7]), int(value[8:10]),
+                int(value[11:13]), int(value[14:16]), int(value[17:19]),
+                tzinfo=timezone.utc,
+            )
+        except ValueError:
+            pass
+    # Python 3.11+ accepts the "Z" suffix directly
+    return datetime.fromisoformat(value)
+
+
+def _to_float(value: Any) -> Optional[float]:
+    """Cast a raw EDR value to float, mapping non-numeric entries to None."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _kelvin_to_celsius(value: Any) -> Optional[float]:
+    """Convert a Kelvin value to Celsius if needed."""
+    value = _to_float(value)
+    if value is None:
+        return None
+    return value - 273.15 if value > 200 else value
+
+
+def _fraction_to_percent(value: Any) -> Optional[float]:
+    """Convert a 0-1 fraction to a percentage if needed."""
+    value = _to_float(value)
+    if value is None:
+        return None
+    return value * 100 if value <= 1 else value
+
+
+# Unit conversion per EDR parameter; anything not listed is only cast to float.
+# Non-numeric entries become None so one bad value cannot fail the whole update
+_CONVERTERS = {
+    EDR_PARAMETERS["temperature"]: _kelvin_to_celsius,
+    EDR_PARAMETERS["dew_point"]: _kelvin_to_celsius,
+    EDR_PARAMETERS["cloud_cover"]: _fraction_to_percent,
+}
+
+
+def _retry_after_delay(retry_after: str | None, attempt: int) -> float:
+    """Return how long to wait after a 429, honouring Retry-After when it is given in seconds."""
+    try:
+        return min(float(retry_after), MAX_RETRY_AFTER)
+    except (TypeError, ValueError):
+        return min(2 ** (attempt + 1), MAX_RETRY_AFTER) + random.uniform(0, 1)
+
+
+def _format_edr_time(value: datetime) -> str:
+    """Format an aware UTC datetime the way the EDR datetime parameter expects."""
+    return value.replace(microsecond=0).isoformat().replace("+00:00", "Z")
+
+
+class DMIAuthError(Exception):
+    """Raised when DMI rejects the API key."""
+
+
 class DMIWeatherAPI:
-    """DMI Weather API client with Docker DNS fallback."""
+    """DMI Weather EDR API client."""
     
     def __init__(self, hass: HomeAssistant, latitude: float, longitude: float, api_key: str) -> None:
         self.hass = hass
         self.latitude = latitude
         self.longitude = longitude
         self.api_key = api_key
-        self.current_data: Dict[str, Any] = {}
-        self.hourly_forecast_data: List[Dict[str, Any]] = []
-        self.forecast_data: List[Dict[str, Any]] = []
+        self._current_data: Optional[HourlyWeather] = None
+        self._hourly_forecast_data: List[HourlyWeather] = []
+        self.forecast_data: List[DailyWeather] = []
+        # Set by the entity once a forecast is asked for; until then only the
+        # current conditions are needed and a one-day window is enough
+        self.forecast_requested = False
         self._last_request_time = 0
         self._rate_limit_delay = 5.0
+        self._rate_lock = asyncio.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
         self._max_retries = 3
-        
-        # Use only the domain name - Home Assistant's HTTP client handles DNS
-        self._api_urls = [
-            DMI_EDR_BASE_URL,  # Original domain
-        ]
+        self._rate_limit_retries = 2
+        self._session: ClientSession | None = None
+        self._headers = {
+            DMI_AUTH_HEADER: api_key,
+            # CoverageJSON compresses well; make sure the server may gzip it
+            "Accept-Encoding": "gzip, deflate",
+            "Accept": "application/prs.coverage+json, application/json",
+        }
+        # Query parameter that stays fixed for the lifetime of the client
+        self._coords_param = f"POINT({longitude} {latitude})"
+        self._collection_id: str | None = None
+        self._collection_expiry = 0.0
+        # Home Assistant's HTTP client handles DNS, so the base URL is used as-is
+        self._collections_url = f"{DMI_EDR_BASE_URL}{EDR_COLLECTIONS_ENDPOINT}"
+
+    @property
+    def current_data(self) -> Optional[HourlyWeather]:
+        """Return the record for the current hour."""
+        return self._current_data
+
+    @property
+    def hourly_forecast_data(self) -> List[HourlyWeather]:
+        """Return the records for the next 24 hours."""
+        return self._hourly_forecast_data
+
+    def _loop_time(self) -> float:
+        """Return the event loop's monotonic time, looking the loop up only once."""
+        if self._loop is None:
+            self._loop = asyncio.get_running_loop()
+        return self._loop.time()
 
     async def _rate_limit(self) -> None:
-        """Ensure minimum delay between API requests to avoid rate limiting."""
-        now = asyncio.get_event_loop().time()
-        time_since_last = now - self._last_request_time
-        if time_since_last < self._rate_limit_delay:
-            delay = self._rate_limit_delay - time_since_last
+        """Ensure minimum delay between API requests to avoid rate limiting.
+
+        Must be called with _rate_lock held, so the gap is measured from the
+        end of the previous response and requests never overlap.
+        """
+        delay = self._last_request_time + self._rate_limit_delay - self._loop_time()
+        if delay > 0:
             await asyncio.sleep(delay)
-        self._last_request_time = asyncio.get_event_loop().time()
 
-    async def _make_request(self, endpoint: str, params: Dict = None) -> Dict[str, Any]:
+    def _get_session(self) -> ClientSession:
+        """Return the pooled HTTP session, resolving it on first use."""
+        if self._session is None:
+            # Home Assistant owns the shared session and its keep-alive pool,
+            # so it is never closed here
+            self._session = async_get_clientsession(self.hass)
+        return self._session
+
+    async def _make_request(self, url: str, params: Dict = None) -> Dict[str, Any]:
         """Make API request using Home Assistant's HTTP client."""
-        headers = {DMI_AUTH_HEADER: self.api_key}
-        
-        # Use Home Assistant's built-in HTTP client
-        session = async_get_clientsession(self.hass)
+        session = self._get_session()
         
-        # Use the domain URL
-        url = f"{self._api_urls[0]}{endpoint}"
-        _LOGGER.debug("Making request to: %s", url)
-        
-        try:
-            async with session.get(url, params=params, headers=headers, timeout=DEFAULT_TIMEOUT) as response:
-                if response.status == 429:
-                    _LOGGER.warning("Rate limit exceeded, waiting before retry")
-                    await asyncio.sleep(10)
-                    raise Exception("Rate limit exceeded, please try again later")
-                elif response.status == 404:
-                    error_text = await response.text()
-                    _LOGGER.error("API returned 404: %s", error_text)
-                    raise Exception("No weather data available for the requested time period. Please try again later.")
-                elif response.status != 200:
-                    error_text = await response.text()
-                    _LOGGER.error("API request failed with status %d: %s", response.status, error_text)
-                    raise Exception(f"API request failed with status {response.status}")
-                
-                data = await response.json()
-                _LOGGER.debug("Successfully connected to DMI API")
-                return data
-                    
-        except asyncio.TimeoutError:
-            _LOGGER.error("Timeout connecting to DMI EDR API")
-            raise Exception("Timeout connecting to DMI EDR API. Please try again.")
-        except Exception as e:
-            _LOGGER.error("Error connecting to DMI EDR API: %s", e)
-            raise Exception(f"Network error: {e}")
+        for attempt in range(self._rate_limit_retries + 1):
+            # Hold the lock across the wait and the request: one request at a
+            # time, each starting at least _rate_limit_delay after the last ended
+            async with self._rate_lock:
+                await self._rate_limit()
+                _LOGGER.debug("Making request to: %s", url)
+
+                try:
+                    async with session.get(url, params=params, headers=self._headers, timeout=REQUEST_TIMEOUT) as response:
+                        if response.status == 429:
+                            if attempt == self._rate_limit_retries:
+                                _LOGGER.warning("Rate limit exceeded, giving up")
+                                raise Exception("Rate limit exceeded, please try again later")
+                            retry_delay = _retry_after_delay(response.headers.get("Retry-After"), attempt)
+                        elif response.status in (401, 403):
+                            _LOGGER.error("API rejected the API key with status %d", response.status)
+                            raise DMIAuthError(f"API key rejected with status {response.status}")
+                        elif response.status == 404:
+                            error_text = await response.text()
+                            _LOGGER.error("API returned 404: %s", error_text)
+                            raise Exception("No weather data available for the requested time period. Please try again later.")
+                        elif response.status != 200:
+                            error_text = await response.text()
+                            _LOGGER.error("API request failed with status %d: %s", response.status, error_text)
+                            raise Exception(f"API request failed with status {response.status}")
+                        else:
+                            # orjson-backed decoder; parses the raw bytes without a str copy
+                            data = json_loads(await response.read())
+                            _LOGGER.debug(
+                                "Successfully connected to DMI API (Content-Encoding: %s)",
+                                response.headers.get("Content-Encoding", "identity"),
+                            )
+                            return data
+
+                except asyncio.TimeoutError:
+                    _LOGGER.error("Timeout connecting to DMI EDR API")
+                    raise Exception("Timeout connecting to DMI EDR API. Please try again.")
+                except DMIAuthError:
+                    raise
+                except Exception as e:
+                    _LOGGER.error("Error connecting to DMI EDR API: %s", e)
+                    raise Exception(f"Network error: {e}")
+                finally:
+                    # Space requests from the end of the previous response, which is
+                    # what DMI throttles on; slow transfers often cover the delay
+                    self._last_request_time = self._loop_time()
+
+            # Retry a 429 in place rather than burning one of update()'s attempts
+            _LOGGER.warning("Rate limit exceeded, retrying in %.0f seconds", retry_delay)
+            await asyncio.sleep(retry_delay)
 
     async def test_connection(self) -> bool:
         """Test API connection without affecting rate limits."""
         try:
-            await self._rate_limit()
             collections = await self._get_collections()
             return len(collections) > 0
         except Exception as e:
@@ -95,32 +270,45 @@ class DMIWeatherAPI:
         """Update weather data from DMI EDR API."""
         for attempt in range(self._max_retries):
             try:
-                await self._rate_limit()
-                collections = await self._get_collections()
-                if not collections:
-                    raise Exception("No EDR collections available")
-
-                collection_id = "harmonie_dini_eps_means"
-                if collection_id not in collections:
-                    collection_id = list(collections.keys())[0]
-                _LOGGER.debug("Using EDR collection: %s", collection_id)
-
+                collection_id = await self._resolve_collection_id()
                 await self._fetch_weather_data(collection_id)
                 return  # Success
             except Exception as err:
                 _LOGGER.warning("Attempt %d/%d failed: %s", attempt + 1, self._max_retries, err)
+                # The cached collection may have been retired; re-resolve it on retry
+                self._collection_id = None
                 if attempt < self._max_retries - 1:
-                    wait_time = (2 ** attempt) * 2
-                    _LOGGER.info("Waiting %d seconds before retry...", wait_time)
+                    # Jitter keeps several entries from retrying in lockstep
+                    wait_time = (2 ** attempt) * 2 + random.uniform(0, 1)
+                    _LOGGER.info("Waiting %.1f seconds before retry...", wait_time)
                     await asyncio.sleep(wait_time)
                 else:
                     _LOGGER.error("All %d attempts failed. Last error: %s", self._max_retries, err)
                     raise
 
+    async def _resolve_collection_id(self) -> str:
+        """Return the EDR collection to query, refreshing it once the cache expires."""
+        now = self._loop_time()
+        if self._collection_id is not None and now < self._collection_expiry:
+            return self._collection_id
+
+        collections = await self._get_collections()
+        if not collections:
+            raise Exception("No EDR collections available")
+
+        collection_id = EDR_DEFAULT_COLLECTION
+        if collection_id not in collections:
+            collection_id = next(iter(collections))
+        _LOGGER.debug("Using EDR collection: %s", collection_id)
+
+        # Keep only the id; the full collections response is not needed again
+        self._collection_id = collection_id
+        self._collection_expiry = now + COLLECTION_CACHE_TTL
+        return collection_id
+
     async def _get_collections(self) -> Dict[str, Any]:
         """Get available EDR collections."""
-        await self._rate_limit()
-        data = await self._make_request(EDR_COLLECTIONS_ENDPOINT)
+        data = await self._make_request(self._collections_url)
         
         # Process collections data
         collections = {}
@@ -132,28 +320,22 @@ class DMIWeatherAPI:
 
     async def _fetch_weather_data(self, collection_id: str) -> Dict[str, Any]:
         """Fetch weather data from DMI EDR API."""
-        await self._rate_limit()
-        
         now = dt_util.utcnow()
-        end_time = now + timedelta(days=MAX_FORECAST_DAYS)
-        start_time_str = now.strftime("%Y-%m-%dT%H:%M:%SZ")
-        end_time_str = end_time.strftime("%Y-%m-%dT%H:%M:%SZ")
+        end_time = now + timedelta(days=MAX_FORECAST_DAYS if self.forecast_requested else 1)
+        start_time_str = _format_edr_time(now)
+        end_time_str = _format_edr_time(end_time)
         _LOGGER.debug("Requesting weather data from %s to %s", start_time_str, end_time_str)
 
-        essential_params = [
-            "temperature-2m", "wind-speed-10m", "gust-wind-speed-10m",
-            "total-precipitation", "fraction-of-cloud-cover", "dew-point-temperature-2m"
-        ]
         params = {
-            "coords": f"POINT({self.longitude} {self.latitude})",
+            "coords": self._coords_param,
             "datetime": f"{start_time_str}/{end_time_str}",
-            "parameter-name": ",".join(essential_params),
+            "parameter-name": EDR_REQUIRED_PARAMS_CSV,
             "f": "CoverageJSON"
         }
 
-        endpoint = f"{EDR_COLLECTIONS_ENDPOINT}/{collection_id}{EDR_POSITION_QUERY}"
-        data = await self._make_request(endpoint, params)
-        self._process_edr_data(data)
+        url = f"{self._collections_url}/{collection_id}{EDR_POSITION_QUERY}"
+        # Hand the response straight over so no frame here keeps it alive
+        self._process_edr_data(await self._make_request(url, params))
 
     def _process_edr_data(self, data: Dict[str, Any]) -> None:
         """Process the CoverageJSON data from EDR API."""
@@ -167,83 +349,125 @@ class DMIWeatherAPI:
         
         # Extract time axis
         time_values = axes.get("t", {}).get("values", [])
-        if not time_values:
+        if not time_values or not isinstance(time_values, list):
             _LOGGER.error("No time values in EDR response")
             return
 
         _LOGGER.debug("Processing %d time steps", len(time_values))
+
+        # Resolve and convert each parameter's values once, up front
+        count = len(time_values)
+        temperatures = self._extract_parameter_values(ranges, EDR_PARAMETERS["temperature"], count)
+        wind_speeds = self._extract_parameter_values(ranges, EDR_PARAMETERS["wind_speed"], count)
+        wind_gusts = self._extract_parameter_values(ranges, EDR_PARAMETERS["wind_gust"], count)
+        precipitations = self._extract_parameter_values(ranges, EDR_PARAMETERS["precipitation"], count)
+        cloud_covers = self._extract_parameter_values(ranges, EDR_PARAMETERS["cloud_cover"], count)
+        dew_points = self._extract_parameter_values(ranges, EDR_PARAMETERS["dew_point"], count)
+
+        # The converted columns are copies; release the decoded response
+        # before building the hourly records to keep peak memory down
+        del data, ranges, domain, axes
         
-        # Process hourly data
+        # Process hourly data; bind the per-hour callables to locals once
         hourly_data = []
+        append = hourly_data.append
+        parse_time = _parse_edr_time
         
-        for i, time_str in enumerate(time_values):
+        for i, (time_str, temperature, wind_speed, wind_gust, precipitation, cloud_cover, dew_point) in enumerate(
+            zip(time_values, temperatures, wind_speeds, wind_gusts, precipitations, cloud_covers, dew_points)
+        ):
             try:
                 # Parse time
-                time_obj = datetime.fromisoformat(time_str.replace("Z", "+00:00"))
-                
-                # Extract weather values for this time step
-                weather_data = {
-                    "time": time_obj,
-                    "temperature": self._extract_parameter_value(ranges, EDR_PARAMETERS["temperature"], i),
-                    "pressure": None,  # Set to None if not requested
-                    "humidity": None,  # Set to None if not requested
-                    "wind_speed": self._extract_parameter_value(ranges, EDR_PARAMETERS["wind_speed"], i),
-                    "wind_gust": self._extract_parameter_value(ranges, EDR_PARAMETERS["wind_gust"], i),
-                    "precipitation": self._extract_parameter_value(ranges, EDR_PARAMETERS["precipitation"], i),
-                    "cloud_cover": self._extract_parameter_value(ranges, EDR_PARAMETERS["cloud_cover"], i),
-                    "dew_point": self._extract_parameter_value(ranges, EDR_PARAMETERS["dew_point"], i),
-                    "weather_code": None,
-                }
-                
-                # Estimate weather condition based on precipitation and cloud cover
-                if weather_data["precipitation"] and weather_data["precipitation"] > 0.1:
-                    weather_data["weather_code"] = "rainy"
-                elif weather_data["cloud_cover"] and weather_data["cloud_cover"] > 80:
-                    weather_data["weather_code"] = "cloudy"
-                elif weather_data["cloud_cover"] and weather_data["cloud_cover"] > 30:
-                    weather_data["weather_code"] = "partlycloudy"
-                else:
-                    weather_data["weather_code"] = "clear"
-                
-                hourly_data.append(weather_data)
-                    
-            except (ValueError, TypeError) as err:
+                time_obj = parse_time(time_str)
+            except (ValueError, TypeError, AttributeError) as err:
                 _LOGGER.warning("Error parsing data at index %d: %s", i, err)
                 continue
 
+            # Estimate weather condition based on precipitation and cloud cover
+            cloud = cloud_cover or 0
+            weather_code = _WEATHER_CODES[
+                ((precipitation or 0) > 0.1) << 2 | (cloud > 80) << 1 | (cloud > 30)
+            ]
+
+            append(HourlyWeather(
+                time=time_obj,
+                temperature=temperature,
+                wind_speed=wind_speed,
+                wind_gust=wind_gust,
+                precipitation=precipitation,
+                cloud_cover=cloud_cover,
+                dew_point=dew_point,
+                weather_code=weather_code,
+            ))
+
         # Set current data to the first time step
         if hourly_data:
-            self.current_data = hourly_data[0].copy()
-            self.hourly_forecast_data = hourly_data[1:25]  # Next 24 hours
-            self.forecast_data = hourly_data[1:]  # All future data
-
-    def _extract_parameter_value(self, ranges: Dict, parameter: str, time_index: int) -> Optional[float]:
-        """Extract parameter value from EDR ranges data."""
-        if parameter not in ranges:
-            return None
-        
-        param_data = ranges[parameter]
-        if "values" not in param_data:
-            return None
-        
-        values = param_data["values"]
-        if time_index >= len(values):
-            return None
-        
-        value = values[time_index]
-        if value is None:
-            return None
-        
-        # Convert temperature from Kelvin to Celsius if needed
-        if parameter == "temperature-2m" and value > 200:
-            value = value - 273.15
+            self._current_data = hourly_data[0]
+            # Sliced once per update so forecast reads return the stored list
+            self._hourly_forecast_data = hourly_data[1:25]
+            self.forecast_data = self._create_daily_forecast(hourly_data[1:])
+
+    def _create_daily_forecast(self, hourly_data: List[HourlyWeather]) -> List[DailyWeather]:
+        """Aggregate hourly records into one record per local calendar day.
+
+        The first day only covers the hours that remain of it. A trailing day
+        the data stops partway through is dropped, since its high, low and
+        totals would not describe the whole day.
+        """
+        buckets: Dict[date, DailyWeather] = {}
+        for hour in hourly_data:
+            date_key = dt_util.as_local(hour.time).date()
+            day = buckets.get(date_key)
+            if day is None:
+                day = buckets[date_key] = DailyWeather(time=hour.time, weather_code=hour.weather_code)
+
+            temp = hour.temperature
+            if temp is not None:
+                day.temperature_max = temp if day.temperature_max is None else max(day.temperature_max, temp)
+                day.temperature_min = temp if day.temperature_min is None else min(day.temperature_min, temp)
+
+            if hour.precipitation is not None:
+                day.precipitation += hour.precipitation
+
+            wind_speed = hour.wind_speed
+            if wind_speed is not None:
+                day.wind_speed = wind_speed if day.wind_speed is None else max(day.wind_speed, wind_speed)
+
+            # Report the most severe condition seen during the day
+            if _CONDITION_RANK[hour.weather_code] > _CONDITION_RANK[day.weather_code]:
+                day.weather_code = hour.weather_code
+
+        # The last day is complete only if the next time step would fall on
+        # the following local day
+        if len(hourly_data) >= 2:
+            last_time = hourly_data[-1].time
+            next_time = last_time + (last_time - hourly_data[-2].time)
+            if dt_util.as_local(next_time).date() == dt_util.as_local(last_time).date():
+                buckets.pop(dt_util.as_local(last_time).date())
+
+        return list(buckets.values())
+
+    def _extract_parameter_values(self, ranges: Dict, parameter: str, count: int) -> List[Optional[float]]:
+        """Extract a parameter's values from EDR ranges data, one per time step."""
+        try:
+            raw_values = ranges[parameter]["values"]
+        except (KeyError, TypeError):
+            return [None] * count
         
-        # Convert dew point from Kelvin to Celsius if needed
-        if parameter == "dew-point-temperature-2m" and value > 200:
-            value = value - 273.15
+        # Validate the shape once so the hourly loop can index without checks
+        if not isinstance(raw_values, list) or len(raw_values) < count:
+            _LOGGER.warning("Ignoring malformed values for EDR parameter %s", parameter)
+            return [None] * count
         
-        # Convert cloud cover from fraction to percentage if needed
-        if parameter == "fraction-of-cloud-cover" and value <= 1:
-            value = value * 100
+        # Convert units in the same pass as the float conversion
+        convert = _CONVERTERS.get(parameter, _to_float)
+        values = [None if value is None else convert(value) for value in raw_values[:count]]
         
-        return float(value)
+        invalid = sum(
+            1 for raw, value in zip(raw_values, values) if value is None and raw is not None
+        )
+        if invalid:
+            _LOGGER.warning(
+                "Ignoring %d non-numeric values for EDR parameter %s", invalid, parameter
+            )
+        return values
@@ -10,9 +10,8 @@ from homeassistant.components.weather import (
     ATTR_FORECAST_NATIVE_PRECIPITATION,
     ATTR_FORECAST_NATIVE_TEMP,
     ATTR_FORECAST_NATIVE_TEMP_LOW,
+    ATTR_FORECAST_NATIVE_WIND_SPEED,
     ATTR_FORECAST_TIME,
-    ATTR_FORECAST_WIND_BEARING,
-    ATTR_FORECAST_WIND_SPEED,
     Forecast,
     WeatherEntity,
     WeatherEntityFeature,
@@ -87,128 +86,71 @@ class DMIWeatherEntity(WeatherEntity):
         except Exception as err:
             _LOGGER.error("Error updating DMI EDR weather: %s", err)
             self._attr_available = False
+            return
 
-    @property
-    def condition(self) -> str | None:
-        """Return the current condition."""
-        if not self._api.current_data:
-            return None
-        
-        # Map DMI weather codes to Home Assistant conditions
-        weather_code = self._api.current_data.get("weather_code")
-        if weather_code is not None:
-            return WEATHER_CONDITIONS.get(str(weather_code), "unknown")
-        
-        return None
-
-    @property
-    def native_temperature(self) -> float | None:
-        """Return the temperature."""
-        if not self._api.current_data:
-            return None
-        return self._api.current_data.get("temperature")
-
-    @property
-    def native_pressure(self) -> float | None:
-        """Return the pressure."""
-        if not self._api.current_data:
-            return None
-        return self._api.current_data.get("pressure")
+        current = self._api.current_data
+        if current is None:
+            return
 
-    @property
-    def native_wind_speed(self) -> float | None:
-        """Return the wind speed."""
-        if not self._api.current_data:
-            return None
-        return self._api.current_data.get("wind_speed")
-
-    @property
-    def wind_bearing(self) -> float | None:
-        """Return the wind bearing."""
-        if not self._api.current_data:
-            return None
-        return self._api.current_data.get("wind_direction")
-
-    @property
-    def native_visibility(self) -> float | None:
-        """Return the visibility."""
-        if not self._api.current_data:
-            return None
-        visibility = self._api.current_data.get("visibility")
-        if visibility is not None:
-            return visibility / 1000  # Convert to km
-        return None
-
-    @property
-    def humidity(self) -> float | None:
-        """Return the humidity."""
-        if not self._api.current_data:
-            return None
-        return self._api.current_data.get("humidity")
-
-    @property
-    def native_wind_gust_speed(self) -> float | None:
-        """Return the wind gust speed."""
-        if not self._api.current_data:
-            return None
-        return self._api.current_data.get("wind_gust")
-
-    @property
-    def cloud_coverage(self) -> float | None:
-        """Return the cloud coverage."""
-        if not self._api.current_data:
-            return None
-        return self._api.current_data.get("cloud_cover")
+        # Map DMI weather codes to Home Assistant conditions
+        self._attr_condition = WEATHER_CONDITIONS.get(current.weather_code, "unknown")
+        self._attr_native_temperature = current.temperature
+        self._attr_native_pressure = current.pressure
+        self._attr_native_wind_speed = current.wind_speed
+        self._attr_humidity = current.humidity
+        self._attr_native_wind_gust_speed = current.wind_gust
+        self._attr_cloud_coverage = current.cloud_cover
+
+        # Push the refreshed forecasts to subscribed frontends
+        await self.async_update_listeners(None)
+
+    async def _async_request_forecast(self) -> None:
+        """Widen the API's fetch window, refreshing once on the first forecast request."""
+        if self._api.forecast_requested:
+            return
+        # Polls so far fetched only one day, so fetch the full window now
+        self._api.forecast_requested = True
+        try:
+            await self._api.update()
+        except Exception as err:
+            _LOGGER.error("Error fetching DMI EDR forecast: %s", err)
 
     async def async_forecast_daily(self) -> list[Forecast] | None:
         """Return the daily forecast."""
+        await self._async_request_forecast()
         if not self._api.forecast_data:
             return None
 
-        forecast_list = []
-        for forecast in self._api.forecast_data:
-            forecast_dict = {
-                ATTR_FORECAST_TIME: forecast.get("time"),
-                ATTR_FORECAST_NATIVE_TEMP: forecast.get("temperature_max"),
-                ATTR_FORECAST_NATIVE_TEMP_LOW: forecast.get("temperature_min"),
-                ATTR_FORECAST_NATIVE_PRECIPITATION: forecast.get("precipitation"),
-                ATTR_FORECAST_WIND_SPEED: forecast.get("wind_speed"),
-                ATTR_FORECAST_WIND_BEARING: forecast.get("wind_direction"),
-            }
-            
-            # Map weather condition
-            weather_code = forecast.get("weather_code")
-            if weather_code is not None:
-                forecast_dict[ATTR_FORECAST_CONDITION] = WEATHER_CONDITIONS.get(
-                    str(weather_code), "unknown"
-                )
-            
-            forecast_list.append(Forecast(**forecast_dict))
-
-        return forecast_list
+        return [
+            Forecast(
+                **{
+                    ATTR_FORECAST_TIME: day.time.isoformat(),
+                    ATTR_FORECAST_NATIVE_TEMP: day.temperature_max,
+                    ATTR_FORECAST_NATIVE_TEMP_LOW: day.temperature_min,
+                    ATTR_FORECAST_NATIVE_PRECIPITATION: day.precipitation,
+                    ATTR_FORECAST_NATIVE_WIND_SPEED: day.wind_speed,
+                    ATTR_FORECAST_CONDITION: WEATHER_CONDITIONS.get(day.weather_code, "unknown"),
+                }
+            )
+            for day in self._api.forecast_data
+        ]
 
     async def async_forecast_hourly(self) -> list[Forecast] | None:
         """Return the hourly forecast."""
-        if not self._api.hourly_forecast_data:
+        await self._async_request_forecast()
+        hourly_forecast_data = self._api.hourly_forecast_data
+        if not hourly_forecast_data:
             return None
 
-        forecast_list = []
-        for forecast in self._api.hourly_forecast_data:
-            forecast_dict = {
-                ATTR_FORECAST_TIME: forecast.get("time"),
-                ATTR_FORECAST_NATIVE_TEMP: forecast.get("temperature"),
-                ATTR_FORECAST_NATIVE_PRECIPITATION: forecast.get("precipitation"),
-                ATTR_FORECAST_WIND_SPEED: forecast.get("wind_speed"),
-                ATTR_FORECAST_WIND_BEARING: forecast.get("wind_direction"),
-            }
-            
-            # Map weather condition
-            weather_code = forecast.get("weather_code")
-            if weather_code is not None:
-                forecast_dict[ATTR_FORECAST_CONDITION] = WEATHER_CONDITIONS.get(
-                    str(weather_code), "unknown"
-                )
-            
-            forecast_list.append(Forecast(**forecast_dict))
-
-        return forecast_list
+        return [
+            Forecast(
+                **{
+                    ATTR_FORECAST_TIME: hour.time.isoformat(),
+                    ATTR_FORECAST_NATIVE_TEMP: hour.temperature,
+                    ATTR_FORECAST_NATIVE_PRECIPITATION: hour.precipitation,
+                    ATTR_FORECAST_NATIVE_WIND_SPEED: hour.wind_speed,
+                    ATTR_FORECAST_CONDITION: WEATHER_CONDITIONS.get(hour.weather_code, "unknown"),
+                }
+            )
+            for hour in hourly_forecast_data
+        ]